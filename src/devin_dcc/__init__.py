@@ -10,13 +10,14 @@ CLI Tool to launch DCC software. For usage, install the program with uv, pipx or
 and run `devin --help`
 """
 
-from pydantic_settings import CliApp
-
-from devin_dcc.cli.devin import Devin
-
 
 def main() -> None:
     """Main entry point for the CLI."""
+    # Imported here so `import devin_dcc` doesn't pull in pydantic and the commands
+    from pydantic_settings import CliApp  # noqa: PLC0415
+
+    from devin_dcc.cli.devin import Devin  # noqa: PLC0415
+
     _ = CliApp.run(Devin)
 
 
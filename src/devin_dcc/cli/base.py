@@ -9,10 +9,8 @@
 import logging
 import logging.config
 import os
-import sys
-from distutils.sysconfig import get_python_lib
-from pathlib import Path
-from typing import Literal
+from functools import cached_property
+from typing import TYPE_CHECKING, Literal
 
 from pydantic import (
     AliasChoices,
@@ -20,14 +18,55 @@ from pydantic import (
     DirectoryPath,
     Field,
     FilePath,
-    computed_field,
 )
 from pydantic_settings import (
     CliImplicitFlag,
 )
 
+from devin_dcc.constants import PREFIX_SITE_DIR
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
 logger = logging.getLogger(__name__)
 
+# Mapping of log level names accepted by the CLI to logging levels
+_LOG_LEVELS: dict[str, int] = {
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.FATAL,
+    "ERROR": logging.ERROR,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
+}
+
+# Handler config, the level is added from the command's log_level when configured
+_STDOUT_HANDLER: dict[str, str] = {
+    "class": "logging.StreamHandler",
+    "formatter": "simple",
+    "stream": "ext://sys.stdout",
+}
+
+_LOGGING_CONFIG: dict[
+    str,
+    int | bool | dict[str, dict[str, str]] | dict[str, dict[str, str | list[str]]],
+] = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "simple": {
+            "format": "%(levelname)s: %(message)s",
+        },
+        "detailed": {
+            "format": "[%(levelname)s|%(module)s|L%(lineno)d] %(asctime)s: %(message)s",
+            "datefmt": "%Y-%m-%dT%H:%M:%S%z",
+        },
+    },
+    "loggers": {"root": {"level": "DEBUG", "handlers": ["stdout"]}},
+}
+
 
 class BaseCommand(BaseModel):
     """Base command model."""
@@ -45,36 +84,14 @@ class BaseCommand(BaseModel):
 
     def configure_logging(self) -> None:
         """Configure logging for the CLI."""
-        logging_config: dict[
-            str,
-            int
-            | bool
-            | dict[str, dict[str, str]]
-            | dict[str, dict[str, str | list[str]]],
-        ] = {
-            "version": 1,
-            "disable_existing_loggers": False,
-            "formatters": {
-                "simple": {
-                    "format": "%(levelname)s: %(message)s",
-                },
-                "detailed": {
-                    "format": "[%(levelname)s|%(module)s|L%(lineno)d] %(asctime)s: %(message)s",  # noqa: E501
-                    "datefmt": "%Y-%m-%dT%H:%M:%S%z",
-                },
-            },
-            "handlers": {
-                "stdout": {
-                    "class": "logging.StreamHandler",
-                    "level": self.log_level,
-                    "formatter": "simple",
-                    "stream": "ext://sys.stdout",
-                },
-            },
-            "loggers": {"root": {"level": "DEBUG", "handlers": ["stdout"]}},
-        }
-        logging.config.dictConfig(logging_config)
-        os.environ["DEVIN_LOG_LEVEL"] = self.log_level
+        stdout_handler = {**_STDOUT_HANDLER, "level": _LOG_LEVELS[self.log_level]}
+        logging.config.dictConfig(
+            {**_LOGGING_CONFIG, "handlers": {"stdout": stdout_handler}},
+        )
+
+        # Read by the DCC bootstrap scripts
+        if os.environ.get("DEVIN_LOG_LEVEL") != self.log_level:
+            os.environ["DEVIN_LOG_LEVEL"] = self.log_level
 
 
 class BaseDCCCommand(BaseCommand):
@@ -106,17 +123,13 @@ class BaseDCCCommand(BaseCommand):
         validation_alias=AliasChoices("executable", "e"),
     )
 
-    @computed_field
-    @property
+    @cached_property
     def _computed_site_path(self) -> str | None:
-        site_dirs: list[Path] = []
-        if self.include_prefix_site:
-            site_dirs = [Path(get_python_lib(prefix=sys.prefix))]
+        if not self.include_prefix_site and not self.site_path:
+            return None
 
+        site_dirs: list[Path] = [PREFIX_SITE_DIR] if self.include_prefix_site else []
         if self.site_path:
             site_dirs.extend(self.site_path)
 
-        if site_dirs:
-            return os.pathsep.join([x.as_posix() for x in site_dirs])
-
-        return None
+        return os.pathsep.join(x.as_posix() for x in site_dirs)
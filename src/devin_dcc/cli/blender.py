@@ -7,10 +7,10 @@
 
 import logging
 import os
-import sys
+from collections.abc import Iterator
 from functools import cached_property
-from subprocess import call
-from typing import TYPE_CHECKING, Literal, TypeAlias
+from pathlib import Path
+from typing import Literal, TypeAlias
 
 from dccpath import get_blender
 from pydantic import (
@@ -19,15 +19,12 @@ from pydantic import (
     Field,
     FilePath,
     ValidationInfo,
-    computed_field,
     field_validator,
 )
 
 from devin_dcc.cli.base import BaseDCCCommand
-from devin_dcc.constants import DATA_DIR
-
-if TYPE_CHECKING:
-    from pathlib import Path
+from devin_dcc.constants import BLENDER_SCRIPTS_DIR, CURRENT_PY, DCC_BASE_ENV
+from devin_dcc.util import launch_executable
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +40,15 @@ BLENDER_PYTHON_MAP: dict[BLENDER_VERSIONS, str] = {
 }
 
 
+def _iter_subdir_names(path: Path) -> Iterator[str]:
+    """Yield the names of all directories in path, nothing if it can't be read."""
+    try:
+        with os.scandir(path) as entries:
+            yield from (x.name for x in entries if x.is_dir())
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return
+
+
 class Blender(BaseDCCCommand):
     """Run Blender."""
 
@@ -72,14 +78,16 @@ class Blender(BaseDCCCommand):
         Only runs if include_prefix_site is set to true, otherwise there's no reason
         the Python version needs to match.
         """
+        if not info.data.get("include_prefix_site"):
+            return value
+
         blender_py_req = BLENDER_PYTHON_MAP.get(value)
-        current_py = f"{sys.version_info.major}.{sys.version_info.minor}"
 
-        if info.data["include_prefix_site"] and current_py != blender_py_req:
+        if blender_py_req != CURRENT_PY:
             msg = (
                 f"Blender {value} requires Python {blender_py_req}, "
                 "unable to launch with the '--include-prefix-site' flag and "
-                f"Python {current_py}. Either remove the flag or run this command "
+                f"Python {CURRENT_PY}. Either remove the flag or run this command "
                 f"again with Python {blender_py_req}"
             )
             logger.error(msg)
@@ -87,44 +95,27 @@ class Blender(BaseDCCCommand):
 
         return value
 
-    @computed_field
     @cached_property
     def system_addons(self) -> list[str]:
         """Get a list of addons from the SYSTEM_EXTENSIONS and _SCRIPTS directories."""
         addons: list[str] = []
-        legacy_addons_dir: Path | None = (
-            self.system_scripts / "addons" if self.system_scripts is not None else None
-        )
-        extension_addons_dir: Path | None = (
-            self.system_extensions / "system"
-            if self.system_extensions is not None
-            else None
-        )
 
-        if legacy_addons_dir is not None:
-            addons.extend([x.name for x in legacy_addons_dir.glob("*") if x.is_dir()])
+        if self.system_scripts is not None:
+            addons.extend(_iter_subdir_names(self.system_scripts / "addons"))
 
-        if extension_addons_dir is not None:
+        if self.system_extensions is not None:
             # Blender recognizes new extension addons by adding 'bl_ext.system' to name
             addons.extend(
-                [
-                    f"bl_ext.system.{x.name}"
-                    for x in extension_addons_dir.glob("*")
-                    if x.is_dir()
-                ],
+                f"bl_ext.system.{x}"
+                for x in _iter_subdir_names(self.system_extensions / "system")
             )
 
         return addons
 
-    @computed_field
     @cached_property
     def env(self) -> dict[str, str]:
         """Set up the Blender environment."""
-        env: dict[str, str] = {
-            **os.environ.copy(),
-            "PYTHONUNBUFFERED": "1",
-            "PYDEVD_DISABLE_FILE_VALIDATION": "1",
-        }
+        env: dict[str, str] = {**os.environ, **DCC_BASE_ENV}
 
         # Add paths in `self.site_path` to Blenders environment.
         # Variable is picked up and added with `site.sitepackages` in bootstrap script
@@ -132,7 +123,7 @@ class Blender(BaseDCCCommand):
             env["BLENDER_SITE_PATH"] = self._computed_site_path
 
         # Contains script to bootstrap Blender and reset variable to default
-        env["BLENDER_USER_SCRIPTS"] = (DATA_DIR / "blender_scripts").as_posix()
+        env["BLENDER_USER_SCRIPTS"] = BLENDER_SCRIPTS_DIR.as_posix()
         if self.system_scripts is not None:
             env["BLENDER_SYSTEM_SCRIPTS"] = self.system_scripts.as_posix()
         if self.system_extensions is not None:
@@ -140,7 +131,6 @@ class Blender(BaseDCCCommand):
 
         return env
 
-    @computed_field
     @cached_property
     def _computed_executable(self) -> FilePath:
         """Get the final executable path to run Blender with."""
@@ -163,19 +153,24 @@ class Blender(BaseDCCCommand):
 
         return blender
 
+    @cached_property
+    def _computed_args(self) -> list[str]:
+        """Get the full list of arguments to launch Blender with."""
+        args: list[str] = [os.fspath(self._computed_executable), *self.args]
+
+        # Easiest way to ensure addons are loaded only for current session
+        if self.system_addons:
+            args.extend(["--addons", ",".join(self.system_addons)])
+
+        return args
+
     def cli_cmd(self) -> None:
         """Blender CLI command.
 
         Launch Blender with the resolved environment and arguments.
         """
         self.configure_logging()
-        args: list[str] = [self._computed_executable.as_posix(), *self.args]
-
-        # Easiest way to ensure addons are loaded only for current session
-        if self.system_addons:
-            args.extend(["--addons", ",".join(self.system_addons)])
-
-        _ = call(
-            args=args,
+        _ = launch_executable(
+            args=self._computed_args,
             env=self.env,
         )
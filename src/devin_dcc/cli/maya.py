@@ -9,10 +9,9 @@
 import logging
 import os
 import sys
-from distutils.sysconfig import get_python_lib
 from functools import cached_property
 from pathlib import Path
-from subprocess import call, check_output
+from subprocess import check_output
 from typing import Literal
 
 from dccpath import get_maya, get_mayapy
@@ -21,12 +20,12 @@ from pydantic import (
     DirectoryPath,
     Field,
     FilePath,
-    computed_field,
 )
 from pydantic_settings import CliImplicitFlag
 
 from devin_dcc.cli.base import BaseDCCCommand
-from devin_dcc.constants import DATA_DIR
+from devin_dcc.constants import DCC_BASE_ENV, MAYA_STARTUP_DIR, PREFIX_SITE_DIR
+from devin_dcc.util import launch_executable
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +36,11 @@ MAYA_VERSIONS = Literal["2022", "2023", "2024", "2025"]
 # Mapping of supported Maya Python versions
 MAYA_PYTHON_MAP = {"2022": "3.7", "2023": "3.9", "2024": "3.10", "2025": "3.11"}
 
+# System wide ngSkinTools install on Linux, added to sitecustomize.py if found
+_NG_SKIN_TOOLS_LINUX_DIR = Path(
+    "/usr/autodesk/ApplicationPlugins/ngskintools2/Contents/scripts",
+)
+
 
 # TODO: Add --temp-config-dir option (see Mobu implementation)
 class MayaBaseCommand(BaseDCCCommand):
@@ -63,39 +67,32 @@ class MayaBaseCommand(BaseDCCCommand):
         description="Extra paths to add to MAYA_MODULE_PATH",
     )
 
-    @computed_field
     @cached_property
     def env(self) -> dict[str, str]:
         """Get the environment to run Maya with."""
-        env = {
-            **os.environ.copy(),
-            "PYTHONUNBUFFERED": "1",
-            "PYDEVD_DISABLE_FILE_VALIDATION": "1",
-        }
+        env = {**os.environ, **DCC_BASE_ENV}
 
         # Set up Maya plugin path
         if self.plugin_path:
             env["MAYA_PLUG_IN_PATH"] = os.pathsep.join(
-                [x.as_posix() for x in self.plugin_path],
+                x.as_posix() for x in self.plugin_path
             )
 
         # Set up Maya module path
         if self.module_path:
             env["MAYA_MODULE_PATH"] = os.pathsep.join(
-                [x.as_posix() for x in self.module_path],
+                x.as_posix() for x in self.module_path
             )
 
-        self.python_path.append(DATA_DIR / "maya_scripts" / "startup")
+        # Set up PYTHONPATH, prepending all paths provided as arguments and the
+        # startup dir containing userSetup.py
+        orig_python_path = env.get("PYTHONPATH")
+        python_paths = [x.as_posix() for x in (*self.python_path, MAYA_STARTUP_DIR)]
 
-        # Set up PYTHONPATH, prepending all paths provided as arguments
-        if self.python_path:
-            orig_python_path = env.get("PYTHONPATH")
-            python_paths = [x.as_posix() for x in self.python_path]
+        if orig_python_path is not None:
+            python_paths.append(orig_python_path)
 
-            if orig_python_path is not None:
-                python_paths.append(orig_python_path)
-
-            env["PYTHONPATH"] = os.pathsep.join(python_paths)
+        env["PYTHONPATH"] = os.pathsep.join(python_paths)
 
         # MAYA_SITE_PATH - extra site dirs (see maya_scripts/userSetup.py)
         if self._computed_site_path is not None:
@@ -113,7 +110,6 @@ class Maya(MayaBaseCommand):
         description="Path to Maya executable",
     )
 
-    @computed_field
     @cached_property
     def _computed_executable(self) -> FilePath:
         if self.executable is not None:
@@ -130,12 +126,16 @@ class Maya(MayaBaseCommand):
             logger.exception(msg=msg)
             raise FileNotFoundError(msg) from e
 
+    @cached_property
+    def _computed_args(self) -> list[str]:
+        """Get the full list of arguments to launch Maya with."""
+        return [os.fspath(self._computed_executable), *self.args]
+
     def cli_cmd(self) -> None:
         """Run Maya with computed arguments and env."""
         self.configure_logging()
-        args = [self._computed_executable.as_posix(), *self.args]
-        _ = call(
-            args=args,
+        _ = launch_executable(
+            args=self._computed_args,
             env=self.env,
         )
 
@@ -161,7 +161,7 @@ class Mayapy(MayaBaseCommand):
         """Create a sitecustomize.py file in prefix site-packages dir."""
         # get site-packages from mayapy
         args = [
-            self._computed_executable.as_posix(),
+            os.fspath(self._computed_executable),
             "-c",
             "from site import getsitepackages;[print(x) for x in getsitepackages()]",
         ]
@@ -169,13 +169,18 @@ class Mayapy(MayaBaseCommand):
             Path(x) for x in check_output(args=args, encoding="utf-8").splitlines()
         ]
 
-        # get ngSkinTools from ApplicationPlugins dir
+        # get ngSkinTools from ApplicationPlugins dir, preferring the user install
+        # and only checking the system location used on the current platform
         ng_skin_tools_paths = [
             Path.home() / "Autodesk/ApplicationPlugins/ngskintools2/Contents/scripts",
-            Path("/usr/autodesk/ApplicationPlugins/ngskintools2/Contents/scripts"),
-            Path(os.getenv("PROGRAMDATA", default=""))
-            / "Autodesk/ApplicationPlugins/ngskintools2/Contents/scripts",
         ]
+        if sys.platform == "win32":
+            ng_skin_tools_paths.append(
+                Path(os.getenv("PROGRAMDATA", default=""))
+                / "Autodesk/ApplicationPlugins/ngskintools2/Contents/scripts",
+            )
+        else:
+            ng_skin_tools_paths.append(_NG_SKIN_TOOLS_LINUX_DIR)
 
         # Add the first ngSkinTools plugin dir that exists to sitepackages
         for p in ng_skin_tools_paths:
@@ -191,7 +196,7 @@ class Mayapy(MayaBaseCommand):
             ],
         )
 
-        sitecustomize = Path(get_python_lib(prefix=sys.prefix)) / "sitecustomize.py"
+        sitecustomize = PREFIX_SITE_DIR / "sitecustomize.py"
         if not sitecustomize.is_file():
             sitecustomize.touch()
 
@@ -204,7 +209,6 @@ class Mayapy(MayaBaseCommand):
         )
         logger.info(msg)
 
-    @computed_field
     @cached_property
     def _computed_executable(self) -> FilePath:
         if self.executable is not None:
@@ -221,6 +225,11 @@ class Mayapy(MayaBaseCommand):
             logger.exception(msg=msg)
             raise FileNotFoundError(msg) from e
 
+    @cached_property
+    def _computed_args(self) -> list[str]:
+        """Get the full list of arguments to launch mayapy with."""
+        return [os.fspath(self._computed_executable), *self.args]
+
     def cli_cmd(self) -> None:
         """Run mayapy with computed args and env."""
         self.configure_logging()
@@ -228,8 +237,7 @@ class Mayapy(MayaBaseCommand):
             self.create_sitecustomize()
             return
 
-        args = [self._computed_executable.as_posix(), *self.args]
-        _ = call(
-            args=args,
+        _ = launch_executable(
+            args=self._computed_args,
             env=self.env,
         )
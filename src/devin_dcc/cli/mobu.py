@@ -8,11 +8,9 @@
 
 import logging
 import os
-import shutil
-import sys
 import tempfile
+from contextlib import nullcontext
 from functools import cached_property
-from subprocess import call
 from typing import Literal
 
 from dccpath import get_mobu, get_mobupy
@@ -22,12 +20,17 @@ from pydantic import (
     Field,
     FilePath,
     ValidationInfo,
-    computed_field,
     field_validator,
 )
 
 from devin_dcc.cli.base import BaseDCCCommand
-from devin_dcc.constants import DATA_DIR
+from devin_dcc.constants import (
+    CURRENT_PY,
+    DCC_BASE_ENV,
+    MOBU_STARTUP_DIR,
+    MOBU_STARTUP_SCRIPT,
+)
+from devin_dcc.util import launch_executable
 
 logger = logging.getLogger(__name__)
 
@@ -54,14 +57,16 @@ class MobuBase(BaseDCCCommand):
         Only runs if include_prefix_site is set to true, otherwise there's no reason
         the Python version needs to match.
         """
+        if not info.data.get("include_prefix_site"):
+            return value
+
         mobu_py_req = MOBU_PYTHON_MAP.get(value)
-        current_py = f"{sys.version_info.major}.{sys.version_info.minor}"
 
-        if info.data["include_prefix_site"] and current_py != mobu_py_req:
+        if mobu_py_req != CURRENT_PY:
             msg = (
                 f"Mobu {value} requires Python {mobu_py_req}, "
                 "unable to launch with the '--include-prefix-site' flag and "
-                f"Python {current_py}. Either remove the flag or run this command "
+                f"Python {CURRENT_PY}. Either remove the flag or run this command "
                 f"again with Python {mobu_py_req}"
             )
             raise ValueError(msg)
@@ -72,7 +77,6 @@ class MobuBase(BaseDCCCommand):
 class Mobupy(MobuBase):
     """Launch mobupy."""
 
-    @computed_field
     @cached_property
     def _computed_executable(self) -> FilePath:
         if self.executable is not None:
@@ -89,23 +93,21 @@ class Mobupy(MobuBase):
             logger.exception(msg=msg)
             raise FileNotFoundError(msg) from e
 
-    @computed_field
+    @cached_property
+    def _computed_args(self) -> list[str]:
+        """Get the full list of arguments to launch mobupy with."""
+        return [os.fspath(self._computed_executable), *self.args]
+
     @cached_property
     def env(self) -> dict[str, str]:
         """Set up the mobupy environment."""
-        env = {
-            **os.environ.copy(),
-            "PYTHONUNBUFFERED": "1",
-            "PYDEVD_DISABLE_FILE_VALIDATION": "1",
-        }
+        env = {**os.environ, **DCC_BASE_ENV}
         # MOBU_SITE_PATH - extra site dirs (see mobu_scripts/startup/bootstrap.py)
         if self._computed_site_path is not None:
             env["MOTIONBUILDER_SITE_PATH"] = self._computed_site_path
 
         # Run bootstrap script when starting the mobupy interpreter
-        env["PYTHONSTARTUP"] = (
-            DATA_DIR / "mobu_scripts" / "startup" / "bootstrap.py"
-        ).as_posix()
+        env["PYTHONSTARTUP"] = MOBU_STARTUP_SCRIPT.as_posix()
 
         return env
 
@@ -115,24 +117,25 @@ class Mobupy(MobuBase):
         Launch mobupy with the resolved environment and arguments.
         """
         self.configure_logging()
-        args = [self._computed_executable.as_posix(), *self.args]
         env = self.env
-        temp_dir = None
 
         # MB_CONFIG_DIR - user config, use to override and run with clean setup
-        if self.temp_config_dir:
-            temp_dir = tempfile.mkdtemp()
-            env["MB_CONFIG_DIR"] = temp_dir
-            logger.info("Created temp config dir: '%s'", temp_dir)
-        try:
-            _ = call(
-                args=args,
+        temp_dir_context = (
+            tempfile.TemporaryDirectory() if self.temp_config_dir else nullcontext()
+        )
+        with temp_dir_context as temp_dir:
+            if temp_dir is not None:
+                env["MB_CONFIG_DIR"] = temp_dir
+                logger.info("Created temp config dir: '%s'", temp_dir)
+
+            _ = launch_executable(
+                args=self._computed_args,
                 env=env,
+                wait=temp_dir is not None,
             )
-        finally:
-            if temp_dir is not None:
-                shutil.rmtree(temp_dir)
-                logger.info("Deleted temp config dir: '%s'", temp_dir)
+
+        if temp_dir is not None:
+            logger.info("Deleted temp config dir: '%s'", temp_dir)
 
 
 class Mobu(MobuBase):
@@ -151,7 +154,6 @@ class Mobu(MobuBase):
         description="Extra paths to add to MOTIONBUILDER_PYTHON_STARTUP",
     )
 
-    @computed_field
     @cached_property
     def _computed_executable(self) -> FilePath:
         if self.executable is not None:
@@ -168,35 +170,31 @@ class Mobu(MobuBase):
             logger.exception(msg=msg)
             raise FileNotFoundError(msg) from e
 
-    @computed_field
+    @cached_property
+    def _computed_args(self) -> list[str]:
+        """Get the full list of arguments to launch Motionbuilder with."""
+        return [os.fspath(self._computed_executable), *self.args]
+
     @cached_property
     def env(self) -> dict[str, str]:
         """Set up the Motionbuilder environment."""
-        env = {
-            **os.environ.copy(),
-            "PYTHONUNBUFFERED": "1",
-            "PYDEVD_DISABLE_FILE_VALIDATION": "1",
-        }
+        env = {**os.environ, **DCC_BASE_ENV}
 
         # MOTIONBUILDER_PLUGIN_PATH - extra plugins (list)
         if self.plugin_path:
             env["MOTIONBUILDER_PLUGIN_PATH"] = os.pathsep.join(
-                [x.as_posix() for x in self.plugin_path],
+                x.as_posix() for x in self.plugin_path
             )
 
         # MOTIONBUILDER_MODULE_PATH - extra modules (list)
         if self.module_path:
             env["MOTIONBUILDER_MODULE_PATH"] = os.pathsep.join(
-                [x.as_posix() for x in self.module_path],
+                x.as_posix() for x in self.module_path
             )
 
         # MOTIONBUILDER_PYTHON_STARTUP - extra startup scripts (list)
-        startup_dirs = [(DATA_DIR / "mobu_scripts" / "startup")]
-        if self.python_startup:
-            startup_dirs.extend(self.python_startup)
-
         env["MOTIONBUILDER_PYTHON_STARTUP"] = os.pathsep.join(
-            [x.as_posix() for x in startup_dirs],
+            x.as_posix() for x in (MOBU_STARTUP_DIR, *self.python_startup)
         )
 
         # MOBU_SITE_PATH - extra site dirs (see mobu_scripts/startup/bootstrap.py)
@@ -211,22 +209,22 @@ class Mobu(MobuBase):
         Launch Motionbuilder with the resolved environment and arguments.
         """
         self.configure_logging()
-        args = [self._computed_executable.as_posix(), *self.args]
         env = self.env
-        temp_dir = None
 
         # MB_CONFIG_DIR - user config, use to override and run with clean setup
-        if self.temp_config_dir:
-            temp_dir = tempfile.mkdtemp()
-            env["MB_CONFIG_DIR"] = temp_dir
-            logger.info("Created temp config dir: '%s'", temp_dir)
+        temp_dir_context = (
+            tempfile.TemporaryDirectory() if self.temp_config_dir else nullcontext()
+        )
+        with temp_dir_context as temp_dir:
+            if temp_dir is not None:
+                env["MB_CONFIG_DIR"] = temp_dir
+                logger.info("Created temp config dir: '%s'", temp_dir)
 
-        try:
-            _ = call(
-                args=args,
+            _ = launch_executable(
+                args=self._computed_args,
                 env=env,
+                wait=temp_dir is not None,
             )
-        finally:
-            if temp_dir is not None:
-                shutil.rmtree(temp_dir)
-                logger.info("Deleted temp config dir: '%s'", temp_dir)
+
+        if temp_dir is not None:
+            logger.info("Deleted temp config dir: '%s'", temp_dir)
@@ -6,11 +6,34 @@
 
 """Devin DCC application constants."""
 
+import sys
+import sysconfig
 from pathlib import Path
+from types import MappingProxyType
 from typing import Literal
 
 DATA_DIR = Path(__file__).parent / "data"
 
+# Startup scripts bootstrapping the DCCs, see the data dir
+BLENDER_SCRIPTS_DIR = DATA_DIR / "blender_scripts"
+MAYA_STARTUP_DIR = DATA_DIR / "maya_scripts" / "startup"
+MOBU_STARTUP_DIR = DATA_DIR / "mobu_scripts" / "startup"
+MOBU_STARTUP_SCRIPT = MOBU_STARTUP_DIR / "bootstrap.py"
+
+# site-packages dir of the Python env the CLI is running in
+PREFIX_SITE_DIR = Path(sysconfig.get_paths()["purelib"])
+
+# Version of the running Python, compared to the DCC Python version maps
+CURRENT_PY = f"{sys.version_info.major}.{sys.version_info.minor}"
+
+# Environment variables set for every DCC process launched by the CLI
+DCC_BASE_ENV = MappingProxyType(
+    {
+        "PYTHONUNBUFFERED": "1",
+        "PYDEVD_DISABLE_FILE_VALIDATION": "1",
+    },
+)
+
 # Supported platforms, following platform.system() return values
 PLATFORMS = Literal["Linux", "Windows"]
 
@@ -14,15 +14,16 @@ BLENDER_USER_SCRIPTS.
 import logging
 import os
 import site
-import sys
 
 logger = logging.getLogger("devin_bootstrap")
-logging.basicConfig(level=os.environ.get("DEVIN_LOG_LEVEL"))
 
 
 BLENDER_USER_SCRIPTS = "BLENDER_USER_SCRIPTS"
 BLENDER_SITE_PATH = "BLENDER_SITE_PATH"
 
+# Set once the bootstrap has run, register may be called more than once
+_initialized = False
+
 
 def add_extra_site_dirs() -> None:
     """Add extra site directories to Blender site-path."""
@@ -31,8 +32,10 @@ def add_extra_site_dirs() -> None:
     if extra_site_dirs is not None:
         directories = extra_site_dirs.split(os.pathsep)
 
-        for d in directories:
-            site.addsitedir(d)
+        # Skip duplicates and empty entries, each addsitedir call scans for .pth files
+        for d in dict.fromkeys(directories):
+            if d:
+                site.addsitedir(d)
 
         msg = f"Added extra site directories to Blender: {extra_site_dirs}"
         logger.info(msg=msg)
@@ -52,7 +55,9 @@ def unset_blender_user_scripts_envvar() -> None:
         del os.environ[BLENDER_USER_SCRIPTS]
 
 
-def _initialize() -> None:  # pyright: ignore[reportUnusedFunction]
+def _initialize() -> None:
+    logging.basicConfig(level=os.environ.get("DEVIN_LOG_LEVEL"))
+
     unset_blender_user_scripts_envvar()
     add_extra_site_dirs()
 
@@ -60,14 +65,13 @@ def _initialize() -> None:  # pyright: ignore[reportUnusedFunction]
 def register() -> None:
     """Run the bootstrap functionality.
 
-    Runs automatically when Blender starts up.
+    Runs automatically when Blender starts up, only initializing the first time.
     """
-    mod = sys.modules[__name__]
-    _initialize = getattr(mod, "_initialize", None)
+    global _initialized  # noqa: PLW0603
 
-    if _initialize is not None:
+    if not _initialized:
         _initialize()
-        del mod._initialize  # type: ignore[misc] # noqa: SLF001 # pyright: ignore[reportAttributeAccessIssue]
+        _initialized = True
 
 
 def unregister() -> None:  # noqa: D103
@@ -23,8 +23,10 @@ def add_extra_site_dirs() -> None:
     if extra_site_dirs is not None:
         directories = extra_site_dirs.split(os.pathsep)
 
-        for d in directories:
-            site.addsitedir(d)
+        # Skip duplicates and empty entries, each addsitedir call scans for .pth files
+        for d in dict.fromkeys(directories):
+            if d:
+                site.addsitedir(d)
 
         msg = f"Added extra site directories: {extra_site_dirs}"
         logger.info(msg=msg)
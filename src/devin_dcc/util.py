@@ -6,13 +6,46 @@
 
 """Devin DCC utilities."""
 
+import os
+import sys
 from pathlib import Path
+from subprocess import call
 
 from devin_dcc.constants import DEVIN_ROOT_DIR
 
 
 def get_user_root_dir() -> Path:
     """Get the user root dir, creating it if it doesn't exist."""
-    if not DEVIN_ROOT_DIR.exists():
-        DEVIN_ROOT_DIR.mkdir(parents=True)
+    DEVIN_ROOT_DIR.mkdir(parents=True, exist_ok=True)
     return DEVIN_ROOT_DIR
+
+
+def launch_executable(
+    args: list[str],
+    env: dict[str, str],
+    *,
+    wait: bool = False,
+) -> int:
+    """Launch an executable with the given arguments and environment.
+
+    On POSIX systems the current process is replaced by the executable, so the CLI
+    doesn't stay resident while the DCC runs. Windows has no real exec, os.execvpe
+    spawns a new process and exits, so there the executable is run as a child process
+    and waited on instead.
+
+    Args:
+        args: The executable followed by the arguments to pass to it.
+        env: The environment to run the executable with.
+        wait: Run the executable as a child process and wait for it to exit, for
+            callers that need to clean up after it.
+
+    Returns:
+        The exit code of the executable, only returned when waiting on it.
+    """
+    if not wait and sys.platform != "win32":
+        # Exec doesn't flush Python's buffers, make sure all output is written first
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execvpe(args[0], args, env)  # noqa: S606
+
+    return call(args=args, env=env)
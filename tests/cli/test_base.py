@@ -0,0 +1,62 @@
+# Copyright (C) 2025 Henrik Wilhelmsen.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at <https://mozilla.org/MPL/2.0/>.
+
+"""Devin DCC base command tests."""
+
+import logging
+import os
+import sys
+from collections.abc import Generator
+
+import pytest
+
+from devin_dcc.cli.base import BaseCommand
+
+
+@pytest.fixture(name="restore_root_logger")
+def fixture_restore_root_logger() -> Generator[logging.Logger, None, None]:
+    """Fixture that restores the root logger handlers and level after the test."""
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    level = root.level
+    yield root
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def get_stdout_handler(root: logging.Logger) -> logging.Handler:
+    """Get the single stdout stream handler on the root logger."""
+    assert len(root.handlers) == 1
+    handler = root.handlers[0]
+    assert isinstance(handler, logging.StreamHandler)
+    assert handler.stream is sys.stdout
+    return handler
+
+
+def test_configure_logging_level_change(
+    restore_root_logger: logging.Logger,
+    mock_env: os._Environ[str],
+) -> None:
+    """Test that configuring logging again applies the new log level."""
+    BaseCommand(log_level="DEBUG").configure_logging()
+    assert get_stdout_handler(restore_root_logger).level == logging.DEBUG
+    assert mock_env["DEVIN_LOG_LEVEL"] == "DEBUG"
+
+    BaseCommand(log_level="ERROR").configure_logging()
+    assert get_stdout_handler(restore_root_logger).level == logging.ERROR
+    assert mock_env["DEVIN_LOG_LEVEL"] == "ERROR"
+
+
+def test_configure_logging_after_reconfigure(
+    restore_root_logger: logging.Logger,
+    mock_env: os._Environ[str],
+) -> None:
+    """Test that the config is applied again if root handlers were replaced."""
+    BaseCommand(log_level="ERROR").configure_logging()
+    logging.basicConfig(force=True)
+
+    BaseCommand(log_level="ERROR").configure_logging()
+    assert get_stdout_handler(restore_root_logger).level == logging.ERROR
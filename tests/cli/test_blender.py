@@ -7,28 +7,30 @@
 """Devin DCC blender CLI tests."""
 
 import os
+import sys
 from collections.abc import Generator
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from pydantic import ValidationError
 from pydantic_settings import CliApp
 
+from devin_dcc.cli.blender import BLENDER_PYTHON_MAP
 from devin_dcc.cli.devin import (
     Devin,
 )
 
 
-@pytest.fixture(name="mock_call")
-def fixture_mock_call() -> Generator[MagicMock | AsyncMock, None, None]:
-    """Fixture that mocks the call function."""
-    with patch("devin_dcc.cli.blender.call") as mock:
+@pytest.fixture(name="mock_launch_executable")
+def fixture_mock_launch_executable() -> Generator[MagicMock, None, None]:
+    """Fixture that mocks the launch_executable function."""
+    with patch("devin_dcc.cli.blender.launch_executable") as mock:
         yield mock
 
 
 @pytest.fixture(name="mock_get_blender")
-def fixture_mock_get_blender() -> Generator[MagicMock | AsyncMock, None, None]:
+def fixture_mock_get_blender() -> Generator[MagicMock, None, None]:
     """Fixture that mocks the Blender executable path."""
     with patch("devin_dcc.cli.blender.get_blender") as mock:
         mock.return_value = Path("usr/local/Blender Foundation/blender 4.3/blender")
@@ -36,21 +38,21 @@ def fixture_mock_get_blender() -> Generator[MagicMock | AsyncMock, None, None]:
 
 
 def test_blender_no_args(
-    mock_call: MagicMock | AsyncMock,
-    mock_get_blender: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
+    mock_get_blender: MagicMock,
     mock_env: os._Environ[str],
 ) -> None:
     """Test that the command runs with no arguments and calls the blender exe."""
     _ = CliApp().run(Devin, cli_args=["blender"])
-    mock_call.assert_called_once()
+    mock_launch_executable.assert_called_once()
 
-    _, kwargs = mock_call.call_args
-    assert kwargs["args"][0] == mock_get_blender.return_value.as_posix()
+    _, kwargs = mock_launch_executable.call_args
+    assert kwargs["args"][0] == os.fspath(mock_get_blender.return_value)
 
 
 def test_blender_args(
-    mock_call: MagicMock | AsyncMock,
-    mock_get_blender: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
+    mock_get_blender: MagicMock,
     mock_env: os._Environ[str],
 ) -> None:
     """Test that the --args option passes values to the Blender exe as expected."""
@@ -61,11 +63,11 @@ def test_blender_args(
         cli_args=["blender", "--args", "[-batch,--foo,bar]"],
     )
 
-    mock_call.assert_called_once()
+    mock_launch_executable.assert_called_once()
 
-    _, kwargs = mock_call.call_args
+    _, kwargs = mock_launch_executable.call_args
     assert kwargs["args"] == [
-        mock_get_blender.return_value.as_posix(),
+        os.fspath(mock_get_blender.return_value),
         "-batch",
         "--foo",
         "bar",
@@ -74,17 +76,17 @@ def test_blender_args(
 
 # TODO: Move input and expected paths to fixtures
 def test_blender_paths(
-    mock_call: MagicMock | AsyncMock,
-    mock_get_blender: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
+    mock_get_blender: MagicMock,
     mock_env: os._Environ[str],
     tmp_path: Path,
 ) -> None:
     """Test that the various path options are passed to their matching env vars."""
     path_count = 10
 
-    system_extensions = Path(tmp_path / "system_extensions")
-    system_scripts = Path(tmp_path / "system_scripts")
-    site_paths = [Path(tmp_path / f"python_{i}") for i in range(path_count)]
+    system_extensions = tmp_path / "system_extensions"
+    system_scripts = tmp_path / "system_scripts"
+    site_paths = [tmp_path / f"python_{i}" for i in range(path_count)]
 
     for path in (system_extensions, system_scripts, *site_paths):
         path.mkdir()
@@ -106,10 +108,10 @@ def test_blender_paths(
             *system_scripts_arg,
         ],
     )
-    mock_call.assert_called_once()
+    mock_launch_executable.assert_called_once()
 
     # Check that the paths passed to the command was added to env
-    _, kwargs = mock_call.call_args
+    _, kwargs = mock_launch_executable.call_args
     expected_site_path = os.pathsep.join([x.as_posix() for x in site_paths])
 
     assert system_extensions.as_posix() == kwargs["env"]["BLENDER_SYSTEM_EXTENSIONS"]
@@ -117,8 +119,63 @@ def test_blender_paths(
     assert expected_site_path in kwargs["env"]["BLENDER_SITE_PATH"]
 
 
+def test_blender_system_addons(
+    mock_launch_executable: MagicMock,
+    mock_get_blender: MagicMock,
+    mock_env: os._Environ[str],
+    tmp_path: Path,
+) -> None:
+    """Test that addon dirs in the system scripts and extensions are enabled."""
+    system_extensions = tmp_path / "system_extensions"
+    system_scripts = tmp_path / "system_scripts"
+
+    (system_scripts / "addons" / "legacy_addon").mkdir(parents=True)
+    (system_extensions / "system" / "extension_addon").mkdir(parents=True)
+    # Files in the addon dirs should not be picked up as addons
+    (system_scripts / "addons" / "not_an_addon.py").touch()
+
+    _ = CliApp().run(
+        Devin,
+        cli_args=[
+            "blender",
+            "--system-extensions",
+            system_extensions.as_posix(),
+            "--system-scripts",
+            system_scripts.as_posix(),
+        ],
+    )
+    mock_launch_executable.assert_called_once()
+
+    _, kwargs = mock_launch_executable.call_args
+    assert kwargs["args"][-2:] == [
+        "--addons",
+        "legacy_addon,bl_ext.system.extension_addon",
+    ]
+
+
+def test_blender_system_addons_unreadable(
+    mock_launch_executable: MagicMock,
+    mock_get_blender: MagicMock,
+    mock_env: os._Environ[str],
+    tmp_path: Path,
+) -> None:
+    """Test that addon dirs that can't be read are skipped instead of failing."""
+    system_scripts = tmp_path / "system_scripts"
+    (system_scripts / "addons" / "legacy_addon").mkdir(parents=True)
+
+    with patch("devin_dcc.cli.blender.os.scandir", side_effect=PermissionError):
+        _ = CliApp().run(
+            Devin,
+            cli_args=["blender", "--system-scripts", system_scripts.as_posix()],
+        )
+
+    mock_launch_executable.assert_called_once()
+    _, kwargs = mock_launch_executable.call_args
+    assert "--addons" not in kwargs["args"]
+
+
 def test_blender_executable_arg(
-    mock_call: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
     mock_env: os._Environ[str],
     tmp_path: Path,
 ) -> None:
@@ -134,21 +191,35 @@ def test_blender_executable_arg(
             executable.as_posix(),
         ],
     )
-    mock_call.assert_called_once()
+    mock_launch_executable.assert_called_once()
 
-    _, kwargs = mock_call.call_args
-    assert kwargs["args"] == [executable.as_posix()]
+    _, kwargs = mock_launch_executable.call_args
+    assert kwargs["args"] == [os.fspath(executable)]
 
 
-def test_blender_invalid_version(mock_get_blender: MagicMock | AsyncMock) -> None:
+def test_blender_invalid_version(mock_get_blender: MagicMock) -> None:
     """Test that a ValidationError is raised if an invalid version is passed."""
     with pytest.raises(ValidationError):
         _ = CliApp().run(Devin, cli_args=["blender", "-v", "invalid"])
 
 
-def test_blender_missing_executable(mock_get_blender: MagicMock | AsyncMock) -> None:
+def test_blender_missing_executable(mock_get_blender: MagicMock) -> None:
     """Test that a FileNotFoundError is raised if executable is not found."""
     mock_get_blender.side_effect = FileNotFoundError
 
     with pytest.raises(FileNotFoundError):
         _ = CliApp().run(Devin, cli_args=["blender"])
+
+
+def test_blender_prefix_site_python_mismatch(
+    mock_get_blender: MagicMock,
+) -> None:
+    """Test that --include-prefix-site fails if the Python version doesn't match."""
+    current_py = f"{sys.version_info.major}.{sys.version_info.minor}"
+    version = next(k for k, v in BLENDER_PYTHON_MAP.items() if v != current_py)
+
+    with pytest.raises(ValidationError):
+        _ = CliApp().run(
+            Devin,
+            cli_args=["blender", "-v", version, "--include-prefix-site"],
+        )
@@ -9,7 +9,7 @@
 import os
 from collections.abc import Generator
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from pydantic import ValidationError
@@ -20,15 +20,15 @@ from devin_dcc.cli.devin import (
 )
 
 
-@pytest.fixture(name="mock_call")
-def fixture_mock_call() -> Generator[MagicMock | AsyncMock, None, None]:
-    """Fixture that mocks the call function."""
-    with patch("devin_dcc.cli.maya.call") as mock:
+@pytest.fixture(name="mock_launch_executable")
+def fixture_mock_launch_executable() -> Generator[MagicMock, None, None]:
+    """Fixture that mocks the launch_executable function."""
+    with patch("devin_dcc.cli.maya.launch_executable") as mock:
         yield mock
 
 
 @pytest.fixture(name="mock_get_maya")
-def fixture_mock_get_maya() -> Generator[MagicMock | AsyncMock, None, None]:
+def fixture_mock_get_maya() -> Generator[MagicMock, None, None]:
     """Fixture that mocks the Maya executable path."""
     with patch("devin_dcc.cli.maya.get_maya") as mock:
         mock.return_value = Path("C:/Program Files/Autodesk/Maya2024/bin/maya.exe")
@@ -36,7 +36,7 @@ def fixture_mock_get_maya() -> Generator[MagicMock | AsyncMock, None, None]:
 
 
 @pytest.fixture(name="mock_get_mayapy")
-def fixture_mock_get_mayapy() -> Generator[MagicMock | AsyncMock, None, None]:
+def fixture_mock_get_mayapy() -> Generator[MagicMock, None, None]:
     """Fixture that mocks the MayaPy executable path."""
     with patch("devin_dcc.cli.maya.get_mayapy") as mock:
         mock.return_value = Path("C:/Program Files/Autodesk/Maya2024/bin/mayapy.exe")
@@ -44,21 +44,21 @@ def fixture_mock_get_mayapy() -> Generator[MagicMock | AsyncMock, None, None]:
 
 
 def test_maya_no_args(
-    mock_call: MagicMock | AsyncMock,
-    mock_get_maya: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
+    mock_get_maya: MagicMock,
     mock_env: os._Environ[str],
 ) -> None:
     """Test that the maya command runs with no arguments and calls the maya exe."""
     _ = CliApp().run(Devin, cli_args=["maya"])
-    mock_call.assert_called_once()
+    mock_launch_executable.assert_called_once()
 
-    _, kwargs = mock_call.call_args
-    assert kwargs["args"] == [mock_get_maya.return_value.as_posix()]
+    _, kwargs = mock_launch_executable.call_args
+    assert kwargs["args"] == [os.fspath(mock_get_maya.return_value)]
 
 
 def test_maya_args(
-    mock_call: MagicMock | AsyncMock,
-    mock_get_maya: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
+    mock_get_maya: MagicMock,
     mock_env: os._Environ[str],
 ) -> None:
     """Test that the --args option passes values to the Maya executable as expected."""
@@ -68,11 +68,11 @@ def test_maya_args(
         # for the CLI to not confuse the -batch argument as a new option
         cli_args=["maya", "--args", "[-batch,--foo,bar]"],
     )
-    mock_call.assert_called_once()
+    mock_launch_executable.assert_called_once()
 
-    _, kwargs = mock_call.call_args
+    _, kwargs = mock_launch_executable.call_args
     assert kwargs["args"] == [
-        mock_get_maya.return_value.as_posix(),
+        os.fspath(mock_get_maya.return_value),
         "-batch",
         "--foo",
         "bar",
@@ -81,17 +81,17 @@ def test_maya_args(
 
 # TODO: Move input and expected paths to fixtures
 def test_maya_paths(
-    mock_call: MagicMock | AsyncMock,
-    mock_get_maya: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
+    mock_get_maya: MagicMock,
     mock_env: os._Environ[str],
     tmp_path: Path,
 ) -> None:
     """Test that the various path options are passed to their matching env vars."""
     path_count = 10
 
-    plugin_paths = [Path(tmp_path / f"plugins_{i}") for i in range(path_count)]
-    module_paths = [Path(tmp_path / f"modules_{i}") for i in range(path_count)]
-    python_paths = [Path(tmp_path / f"python_{i}") for i in range(path_count)]
+    plugin_paths = [tmp_path / f"plugins_{i}" for i in range(path_count)]
+    module_paths = [tmp_path / f"modules_{i}" for i in range(path_count)]
+    python_paths = [tmp_path / f"python_{i}" for i in range(path_count)]
 
     for path in [*plugin_paths, *module_paths, *python_paths]:
         path.mkdir()
@@ -117,7 +117,7 @@ def test_maya_paths(
     ]
 
     # Run the cli
-    _ = CliApp().run(
+    devin = CliApp().run(
         Devin,
         cli_args=[
             "maya",
@@ -127,8 +127,8 @@ def test_maya_paths(
         ],
     )
 
-    mock_call.assert_called_once()
-    _, kwargs = mock_call.call_args
+    mock_launch_executable.assert_called_once()
+    _, kwargs = mock_launch_executable.call_args
 
     # Check that the paths passed to the command was added to env
     expected_plugin_path = os.pathsep.join([x.as_posix() for x in plugin_paths])
@@ -139,16 +139,20 @@ def test_maya_paths(
     assert expected_module_path in kwargs["env"]["MAYA_MODULE_PATH"]
     assert expected_python_path in kwargs["env"]["PYTHONPATH"]
 
+    # Building the env should not add the startup dir to the parsed arguments
+    assert devin.maya is not None
+    assert devin.maya.python_path == python_paths
+
 
 def test_maya_existing_python_path(
-    mock_call: MagicMock | AsyncMock,
-    mock_get_maya: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
+    mock_get_maya: MagicMock,
     mock_env: os._Environ[str],
     tmp_path: Path,
 ) -> None:
     """Test that the --python-path argument respects existing PYTHONPATH values."""
     path_count = 10
-    python_paths = [Path(tmp_path / f"python_{i}") for i in range(path_count)]
+    python_paths = [tmp_path / f"python_{i}" for i in range(path_count)]
 
     for path in python_paths:
         path.mkdir()
@@ -170,8 +174,8 @@ def test_maya_existing_python_path(
         ],
     )
 
-    mock_call.assert_called_once()
-    _, kwargs = mock_call.call_args
+    mock_launch_executable.assert_called_once()
+    _, kwargs = mock_launch_executable.call_args
     expected_python_path = os.pathsep.join([x.as_posix() for x in python_paths])
 
     assert expected_python_path in kwargs["env"]["PYTHONPATH"]
@@ -179,7 +183,7 @@ def test_maya_existing_python_path(
 
 
 def test_maya_executable_arg(
-    mock_call: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
     mock_env: os._Environ[str],
     tmp_path: Path,
 ) -> None:
@@ -196,19 +200,19 @@ def test_maya_executable_arg(
         ],
     )
 
-    mock_call.assert_called_once()
-    _, kwargs = mock_call.call_args
+    mock_launch_executable.assert_called_once()
+    _, kwargs = mock_launch_executable.call_args
 
-    assert kwargs["args"] == [executable.as_posix()]
+    assert kwargs["args"] == [os.fspath(executable)]
 
 
-def test_maya_invalid_version(mock_get_maya: MagicMock | AsyncMock) -> None:
+def test_maya_invalid_version(mock_get_maya: MagicMock) -> None:
     """Test that a ValidationError is raised if an invalid version is passed."""
     with pytest.raises(ValidationError):
         _ = CliApp().run(Devin, cli_args=["maya", "-v", "invalid"])
 
 
-def test_maya_missing_executable(mock_get_maya: MagicMock | AsyncMock) -> None:
+def test_maya_missing_executable(mock_get_maya: MagicMock) -> None:
     """Test that a FileNotFoundError is raised if the get_maya function returns None."""
     mock_get_maya.side_effect = FileNotFoundError
 
@@ -217,20 +221,20 @@ def test_maya_missing_executable(mock_get_maya: MagicMock | AsyncMock) -> None:
 
 
 def test_mayapy_no_args(
-    mock_call: MagicMock | AsyncMock,
-    mock_get_mayapy: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
+    mock_get_mayapy: MagicMock,
     mock_env: os._Environ[str],
 ) -> None:
     """Test that the maya command runs with no arguments and calls the maya exe."""
     _ = CliApp().run(Devin, cli_args=["mayapy"])
-    mock_call.assert_called_once()
-    _, kwargs = mock_call.call_args
-    assert kwargs["args"][0] == mock_get_mayapy.return_value.as_posix()
+    mock_launch_executable.assert_called_once()
+    _, kwargs = mock_launch_executable.call_args
+    assert kwargs["args"][0] == os.fspath(mock_get_mayapy.return_value)
 
 
 def test_mayapy_args(
-    mock_call: MagicMock | AsyncMock,
-    mock_get_mayapy: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
+    mock_get_mayapy: MagicMock,
     mock_env: os._Environ[str],
 ) -> None:
     """Test that the --args option passes values to the Maya executable as expected."""
@@ -241,11 +245,11 @@ def test_mayapy_args(
         cli_args=["mayapy", "--args", "[-batch,--foo,bar]"],
     )
 
-    mock_call.assert_called_once()
-    _, kwargs = mock_call.call_args
+    mock_launch_executable.assert_called_once()
+    _, kwargs = mock_launch_executable.call_args
 
     assert kwargs["args"] == [
-        mock_get_mayapy.return_value.as_posix(),
+        os.fspath(mock_get_mayapy.return_value),
         "-batch",
         "--foo",
         "bar",
@@ -253,7 +257,7 @@ def test_mayapy_args(
 
 
 def test_mayapy_executable_arg(
-    mock_call: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
     mock_env: os._Environ[str],
     tmp_path: Path,
 ) -> None:
@@ -270,15 +274,88 @@ def test_mayapy_executable_arg(
         ],
     )
 
-    mock_call.assert_called_once()
-    _, kwargs = mock_call.call_args
+    mock_launch_executable.assert_called_once()
+    _, kwargs = mock_launch_executable.call_args
 
-    assert kwargs["args"] == [executable.as_posix()]
+    assert kwargs["args"] == [os.fspath(executable)]
 
 
-def test_mayapy_missing_executable(mock_get_mayapy: MagicMock | AsyncMock) -> None:
+def test_mayapy_missing_executable(mock_get_mayapy: MagicMock) -> None:
     """Test that a FileNotFoundError is raised if the get_maya function returns None."""
     mock_get_mayapy.side_effect = FileNotFoundError
 
     with pytest.raises(FileNotFoundError):
         _ = CliApp().run(Devin, cli_args=["mayapy"])
+
+
+def test_mayapy_create_prefix_sitecustomize(
+    mock_launch_executable: MagicMock,
+    mock_get_mayapy: MagicMock,
+    mock_env: os._Environ[str],
+    tmp_path: Path,
+) -> None:
+    """Test that a sitecustomize.py adding mayapy's site dirs is created in prefix."""
+    maya_site = tmp_path / "maya" / "site-packages"
+    prefix_site = tmp_path / "prefix" / "site-packages"
+    prefix_site.mkdir(parents=True)
+
+    with (
+        patch("devin_dcc.cli.maya.check_output") as mock_check_output,
+        patch("devin_dcc.cli.maya.PREFIX_SITE_DIR", prefix_site),
+    ):
+        mock_check_output.return_value = f"{maya_site.as_posix()}\n"
+        _ = CliApp().run(Devin, cli_args=["mayapy", "--create-prefix-sitecustomize"])
+
+    mock_launch_executable.assert_not_called()
+    sitecustomize = (prefix_site / "sitecustomize.py").read_text()
+    assert f"site.addsitedir('{maya_site.as_posix()}')" in sitecustomize
+
+
+@pytest.mark.parametrize(
+    ("platform", "existing", "expected"),
+    [
+        ("linux", ["home", "usr", "programdata"], "home"),
+        ("linux", ["usr", "programdata"], "usr"),
+        ("linux", ["programdata"], None),
+        ("win32", ["home", "usr", "programdata"], "home"),
+        ("win32", ["usr", "programdata"], "programdata"),
+        ("win32", ["usr"], None),
+    ],
+)
+@pytest.mark.usefixtures("mock_get_mayapy")
+def test_mayapy_create_prefix_sitecustomize_ng_skin_tools(
+    mock_env: os._Environ[str],
+    tmp_path: Path,
+    platform: str,
+    existing: list[str],
+    expected: str | None,
+) -> None:
+    """Test that the first ngSkinTools dir for the platform is added to site dirs."""
+    scripts = "Autodesk/ApplicationPlugins/ngskintools2/Contents/scripts"
+    candidates = {
+        "home": tmp_path / "home" / scripts,
+        "usr": tmp_path / "usr" / scripts,
+        "programdata": tmp_path / "programdata" / scripts,
+    }
+    for name in existing:
+        candidates[name].mkdir(parents=True)
+
+    prefix_site = tmp_path / "prefix" / "site-packages"
+    prefix_site.mkdir(parents=True)
+
+    # Path.home reads HOME on POSIX and USERPROFILE on Windows
+    mock_env["HOME"] = mock_env["USERPROFILE"] = (tmp_path / "home").as_posix()
+    mock_env["PROGRAMDATA"] = (tmp_path / "programdata").as_posix()
+
+    with (
+        patch("devin_dcc.cli.maya.check_output") as mock_check_output,
+        patch("devin_dcc.cli.maya.PREFIX_SITE_DIR", prefix_site),
+        patch("devin_dcc.cli.maya.sys.platform", platform),
+        patch("devin_dcc.cli.maya._NG_SKIN_TOOLS_LINUX_DIR", candidates["usr"]),
+    ):
+        mock_check_output.return_value = ""
+        _ = CliApp().run(Devin, cli_args=["mayapy", "--create-prefix-sitecustomize"])
+
+    sitecustomize = (prefix_site / "sitecustomize.py").read_text()
+    added = [x for x in candidates.values() if x.as_posix() in sitecustomize]
+    assert added == ([] if expected is None else [candidates[expected]])
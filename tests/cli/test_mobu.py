@@ -8,10 +8,11 @@
 
 import os
 import sys
+import sysconfig
+import tempfile
 from collections.abc import Generator
-from distutils.sysconfig import get_python_lib
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from pydantic import ValidationError
@@ -20,17 +21,21 @@ from pydantic_settings import CliApp
 from devin_dcc.cli.devin import (
     Devin,
 )
+from devin_dcc.cli.mobu import MOBU_PYTHON_MAP
 
+# Expected prefix site-packages dir, computed independently of the CLI's constant
+_PREFIX_SITE_POSIX = Path(sysconfig.get_paths()["purelib"]).as_posix()
 
-@pytest.fixture(name="mock_call")
-def fixture_mock_call() -> Generator[MagicMock | AsyncMock, None, None]:
-    """Fixture that mocks the call function."""
-    with patch("devin_dcc.cli.mobu.call") as mock:
+
+@pytest.fixture(name="mock_launch_executable")
+def fixture_mock_launch_executable() -> Generator[MagicMock, None, None]:
+    """Fixture that mocks the launch_executable function."""
+    with patch("devin_dcc.cli.mobu.launch_executable") as mock:
         yield mock
 
 
 @pytest.fixture(name="mock_get_mobu")
-def fixture_mock_get_mobu() -> Generator[MagicMock | AsyncMock, None, None]:
+def fixture_mock_get_mobu() -> Generator[MagicMock, None, None]:
     """Fixture that mocks the MotionBuilder executable path."""
     with patch("devin_dcc.cli.mobu.get_mobu") as mock:
         mock.return_value = Path(
@@ -40,7 +45,7 @@ def fixture_mock_get_mobu() -> Generator[MagicMock | AsyncMock, None, None]:
 
 
 @pytest.fixture(name="mock_get_mobupy")
-def fixture_mock_get_mobupy() -> Generator[MagicMock | AsyncMock, None, None]:
+def fixture_mock_get_mobupy() -> Generator[MagicMock, None, None]:
     """Fixture that mocks the MotionBuilder Python executable path."""
     with patch("devin_dcc.cli.mobu.get_mobupy") as mock:
         mock.return_value = Path(
@@ -50,20 +55,20 @@ def fixture_mock_get_mobupy() -> Generator[MagicMock | AsyncMock, None, None]:
 
 
 def test_mobu_no_args(
-    mock_call: MagicMock | AsyncMock,
-    mock_get_mobu: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
+    mock_get_mobu: MagicMock,
     mock_env: os._Environ[str],
 ) -> None:
     """Test that the mobu command runs with no arguments and calls the mobu exe."""
     CliApp().run(Devin, cli_args=["mobu"])
-    mock_call.assert_called_once()
-    _, kwargs = mock_call.call_args
-    assert kwargs["args"] == [mock_get_mobu.return_value.as_posix()]
+    mock_launch_executable.assert_called_once()
+    _, kwargs = mock_launch_executable.call_args
+    assert kwargs["args"] == [os.fspath(mock_get_mobu.return_value)]
 
 
 def test_mobu_args(
-    mock_call: MagicMock | AsyncMock,
-    mock_get_mobu: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
+    mock_get_mobu: MagicMock,
     mock_env: os._Environ[str],
 ) -> None:
     """Test that the --args option passes values to the mobu executable as expected."""
@@ -74,11 +79,11 @@ def test_mobu_args(
         cli_args=["mobu", "--args", "[-batch,--foo,bar]"],
     )
 
-    mock_call.assert_called_once()
-    _, kwargs = mock_call.call_args
+    mock_launch_executable.assert_called_once()
+    _, kwargs = mock_launch_executable.call_args
 
     assert kwargs["args"] == [
-        mock_get_mobu.return_value.as_posix(),
+        os.fspath(mock_get_mobu.return_value),
         "-batch",
         "--foo",
         "bar",
@@ -86,20 +91,20 @@ def test_mobu_args(
 
 
 def test_mobupy_no_args(
-    mock_call: MagicMock | AsyncMock,
-    mock_get_mobupy: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
+    mock_get_mobupy: MagicMock,
     mock_env: os._Environ[str],
 ) -> None:
     """Test that the mobu command runs with no arguments and calls the mobu exe."""
     CliApp().run(Devin, cli_args=["mobupy"])
-    mock_call.assert_called_once()
-    _, kwargs = mock_call.call_args
-    assert kwargs["args"] == [mock_get_mobupy.return_value.as_posix()]
+    mock_launch_executable.assert_called_once()
+    _, kwargs = mock_launch_executable.call_args
+    assert kwargs["args"] == [os.fspath(mock_get_mobupy.return_value)]
 
 
 def test_mobupy_args(
-    mock_call: MagicMock | AsyncMock,
-    mock_get_mobupy: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
+    mock_get_mobupy: MagicMock,
     mock_env: os._Environ[str],
 ) -> None:
     """Test that the --args option passes values to the mobupy executable."""
@@ -110,11 +115,11 @@ def test_mobupy_args(
         cli_args=["mobupy", "--args", "[-batch,--foo,bar]"],
     )
 
-    mock_call.assert_called_once()
-    _, kwargs = mock_call.call_args
+    mock_launch_executable.assert_called_once()
+    _, kwargs = mock_launch_executable.call_args
 
     assert kwargs["args"] == [
-        mock_get_mobupy.return_value.as_posix(),
+        os.fspath(mock_get_mobupy.return_value),
         "-batch",
         "--foo",
         "bar",
@@ -123,45 +128,49 @@ def test_mobupy_args(
 
 # TODO: Move input and expected paths to fixtures
 def test_mobu_paths(
-    mock_call: MagicMock | AsyncMock,
-    mock_get_mobu: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
+    mock_get_mobu: MagicMock,
     mock_env: os._Environ[str],
     tmp_path: Path,
 ) -> None:
     """Test that the various path options are passed to their matching env vars."""
     path_count = 10
 
-    site_paths = [Path(tmp_path / f"site_{i}") for i in range(path_count)]
-    plugin_paths = [Path(tmp_path / f"plugins_{i}") for i in range(path_count)]
-    module_paths = [Path(tmp_path / f"modules_{i}") for i in range(path_count)]
-    python_startup_paths = [Path(tmp_path / f"python_{i}") for i in range(path_count)]
+    site_paths = [tmp_path / f"site_{i}" for i in range(path_count)]
+    plugin_paths = [tmp_path / f"plugins_{i}" for i in range(path_count)]
+    module_paths = [tmp_path / f"modules_{i}" for i in range(path_count)]
+    python_startup_paths = [tmp_path / f"python_{i}" for i in range(path_count)]
 
     for path in [*plugin_paths, *module_paths, *site_paths, *python_startup_paths]:
         path.mkdir()
 
+    # Posix strings used both for the CLI args and the expected env values
+    site_posix = [x.as_posix() for x in site_paths]
+    plugin_posix = [x.as_posix() for x in plugin_paths]
+    module_posix = [x.as_posix() for x in module_paths]
+    python_startup_posix = [x.as_posix() for x in python_startup_paths]
+
     # Pydantic supports JSON, Argparse and lazy style lists
     # https://docs.pydantic.dev/latest/concepts/pydantic_settings/#lists
 
     # Argparse style with multiple --plugin-path passed
-    plugin_args = [
-        item for p in plugin_paths for item in ("--plugin-path", p.as_posix())
-    ]
+    plugin_args = [item for p in plugin_posix for item in ("--plugin-path", p)]
 
     # JSON style, with a comma-separated list within brackets []
     module_args = [
         "--module-path",
-        f"[{','.join([x.as_posix() for x in module_paths])}]",
+        f"[{','.join(module_posix)}]",
     ]
 
     # Lazy style, with a comma-separated list without the brackets
     site_args = [
         "--site-path",
-        ",".join([x.as_posix() for x in site_paths]),
+        ",".join(site_posix),
     ]
 
     startup_args = [
         "--python-startup",
-        ",".join([x.as_posix() for x in python_startup_paths]),
+        ",".join(python_startup_posix),
     ]
 
     # Run the cli
@@ -176,16 +185,14 @@ def test_mobu_paths(
         ],
     )
 
-    mock_call.assert_called_once()
-    _, kwargs = mock_call.call_args
+    mock_launch_executable.assert_called_once()
+    _, kwargs = mock_launch_executable.call_args
 
     # Check that the paths passed to the command was added to env
-    expected_plugin_path = os.pathsep.join([x.as_posix() for x in plugin_paths])
-    expected_module_path = os.pathsep.join([x.as_posix() for x in module_paths])
-    expected_site_path = os.pathsep.join([x.as_posix() for x in site_paths])
-    expected_startup_path = os.pathsep.join(
-        [x.as_posix() for x in python_startup_paths],
-    )
+    expected_plugin_path = os.pathsep.join(plugin_posix)
+    expected_module_path = os.pathsep.join(module_posix)
+    expected_site_path = os.pathsep.join(site_posix)
+    expected_startup_path = os.pathsep.join(python_startup_posix)
 
     assert expected_plugin_path in kwargs["env"]["MOTIONBUILDER_PLUGIN_PATH"]
     assert expected_module_path in kwargs["env"]["MOTIONBUILDER_MODULE_PATH"]
@@ -194,7 +201,7 @@ def test_mobu_paths(
 
 
 def test_mobu_executable_arg(
-    mock_call: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
     mock_env: os._Environ[str],
     tmp_path: Path,
 ) -> None:
@@ -211,14 +218,14 @@ def test_mobu_executable_arg(
         ],
     )
 
-    mock_call.assert_called_once()
-    _, kwargs = mock_call.call_args
+    mock_launch_executable.assert_called_once()
+    _, kwargs = mock_launch_executable.call_args
 
-    assert kwargs["args"][0] == executable.as_posix()
+    assert kwargs["args"][0] == os.fspath(executable)
 
 
 def test_mobupy_executable_arg(
-    mock_call: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
     mock_env: os._Environ[str],
     tmp_path: Path,
 ) -> None:
@@ -235,14 +242,14 @@ def test_mobupy_executable_arg(
         ],
     )
 
-    mock_call.assert_called_once()
-    _, kwargs = mock_call.call_args
+    mock_launch_executable.assert_called_once()
+    _, kwargs = mock_launch_executable.call_args
 
-    assert kwargs["args"][0] == executable.as_posix()
+    assert kwargs["args"][0] == os.fspath(executable)
 
 
 def test_mobu_executable_arg_non_existing(
-    mock_call: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
     mock_env: os._Environ[str],
     tmp_path: Path,
 ) -> None:
@@ -261,7 +268,7 @@ def test_mobu_executable_arg_non_existing(
 
 
 def test_mobupy_executable_arg_non_existing(
-    mock_call: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
     mock_env: os._Environ[str],
     tmp_path: Path,
 ) -> None:
@@ -279,19 +286,19 @@ def test_mobupy_executable_arg_non_existing(
         )
 
 
-def test_mobu_invalid_version(mock_get_mobu: MagicMock | AsyncMock) -> None:
+def test_mobu_invalid_version(mock_get_mobu: MagicMock) -> None:
     """Test that a ValidationError is raised if an invalid version is passed."""
     with pytest.raises(ValidationError):
         CliApp().run(Devin, cli_args=["mobu", "-v", "invalid"])
 
 
-def test_mobupy_invalid_version(mock_get_mobupy: MagicMock | AsyncMock) -> None:
+def test_mobupy_invalid_version(mock_get_mobupy: MagicMock) -> None:
     """Test that a ValidationError is raised if an invalid version is passed."""
     with pytest.raises(ValidationError):
         CliApp().run(Devin, cli_args=["mobupy", "-v", "invalid"])
 
 
-def test_mobu_missing_executable(mock_get_mobu: MagicMock | AsyncMock) -> None:
+def test_mobu_missing_executable(mock_get_mobu: MagicMock) -> None:
     """Test that a FileNotFoundError is raised if the get_mobu returns None."""
     mock_get_mobu.side_effect = FileNotFoundError
 
@@ -299,7 +306,7 @@ def test_mobu_missing_executable(mock_get_mobu: MagicMock | AsyncMock) -> None:
         _ = CliApp().run(Devin, cli_args=["mobu"])
 
 
-def test_mobupy_missing_executable(mock_get_mobupy: MagicMock | AsyncMock) -> None:
+def test_mobupy_missing_executable(mock_get_mobupy: MagicMock) -> None:
     """Test that a FileNotFoundError is raised if the get_mobupy returns None."""
     mock_get_mobupy.side_effect = FileNotFoundError
 
@@ -308,62 +315,82 @@ def test_mobupy_missing_executable(mock_get_mobupy: MagicMock | AsyncMock) -> No
 
 
 def test_mobu_with_temp_config(
-    mock_call: MagicMock | AsyncMock,
-    mock_get_mobu: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
+    mock_get_mobu: MagicMock,
     mock_env: os._Environ[str],
-    tmp_path: Path,
 ) -> None:
     """Test that the --temp-config-dir option creates and uses a tmp config dir."""
-    with patch("tempfile.mkdtemp") as mock_mkdtemp:
-        mock_mkdtemp.return_value = str(tmp_path)
-        CliApp().run(Devin, cli_args=["mobu", "--temp-config-dir"])
+    CliApp().run(Devin, cli_args=["mobu", "--temp-config-dir"])
+
+    _, kwargs = mock_launch_executable.call_args
+    temp_config_dir = Path(kwargs["env"]["MB_CONFIG_DIR"])
+    assert temp_config_dir.parent == Path(tempfile.gettempdir())
+    # Has to wait for mobu to exit to be able to clean up the temp dir
+    assert kwargs["wait"]
 
-        _, kwargs = mock_call.call_args
-        assert kwargs["env"]["MB_CONFIG_DIR"] == str(tmp_path)
+    # The temp config dir is deleted once the launched process has exited
+    assert not temp_config_dir.exists()
 
 
 def test_mobupy_with_temp_config(
-    mock_call: MagicMock | AsyncMock,
-    mock_get_mobupy: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
+    mock_get_mobupy: MagicMock,
     mock_env: os._Environ[str],
-    tmp_path: Path,
 ) -> None:
     """Test that the --temp-config-dir option creates and uses a tmp config dir."""
-    with patch("tempfile.mkdtemp") as mock_mkdtemp:
-        mock_mkdtemp.return_value = str(tmp_path)
-        CliApp().run(Devin, cli_args=["mobupy", "--temp-config-dir"])
+    CliApp().run(Devin, cli_args=["mobupy", "--temp-config-dir"])
+
+    _, kwargs = mock_launch_executable.call_args
+    temp_config_dir = Path(kwargs["env"]["MB_CONFIG_DIR"])
+    assert temp_config_dir.parent == Path(tempfile.gettempdir())
+    # Has to wait for mobupy to exit to be able to clean up the temp dir
+    assert kwargs["wait"]
 
-        _, kwargs = mock_call.call_args
-        assert kwargs["env"]["MB_CONFIG_DIR"] == str(tmp_path)
+    # The temp config dir is deleted once the launched process has exited
+    assert not temp_config_dir.exists()
 
 
 def test_mobu_with_prefix_site(
-    mock_call: MagicMock | AsyncMock,
-    mock_get_mobu: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
+    mock_get_mobu: MagicMock,
     mock_env: os._Environ[str],
     tmp_path: Path,
 ) -> None:
     """Test that the --include-prefix-site option adds prefix site to env var."""
-    expected = Path(get_python_lib(prefix=sys.prefix)).as_posix()
+    expected = _PREFIX_SITE_POSIX
     _ = CliApp().run(Devin, cli_args=["mobu", "--include-prefix-site"])
 
-    _, kwargs = mock_call.call_args
+    _, kwargs = mock_launch_executable.call_args
     result = kwargs["env"]["MOTIONBUILDER_SITE_PATH"]
 
     assert expected in result
 
 
 def test_mobupy_with_prefix_site(
-    mock_call: MagicMock | AsyncMock,
-    mock_get_mobupy: MagicMock | AsyncMock,
+    mock_launch_executable: MagicMock,
+    mock_get_mobupy: MagicMock,
     mock_env: os._Environ[str],
     tmp_path: Path,
 ) -> None:
     """Test that the --include-prefix-site option adds prefix site to env var."""
-    expected = Path(get_python_lib(prefix=sys.prefix)).as_posix()
+    expected = _PREFIX_SITE_POSIX
     _ = CliApp().run(Devin, cli_args=["mobupy", "--include-prefix-site"])
 
-    _, kwargs = mock_call.call_args
+    _, kwargs = mock_launch_executable.call_args
     result = kwargs["env"]["MOTIONBUILDER_SITE_PATH"]
 
     assert expected in result
+
+
+def test_mobu_prefix_site_python_mismatch(
+    mock_get_mobu: MagicMock,
+) -> None:
+    """Test that --include-prefix-site fails if the Python version doesn't match."""
+    current_py = f"{sys.version_info.major}.{sys.version_info.minor}"
+    version = next(k for k, v in MOBU_PYTHON_MAP.items() if v != current_py)
+
+    with pytest.raises(ValidationError):
+        _ = CliApp().run(
+            Devin,
+            cli_args=["mobu", "-v", version, "--include-prefix-site"],
+        )
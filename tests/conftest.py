@@ -9,7 +9,7 @@
 import os
 from collections.abc import Generator
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -22,7 +22,7 @@ def fixture_mock_env() -> Generator[os._Environ[str], None, None]:
 
 
 @pytest.fixture(name="mock_get_blender")
-def fixture_mock_get_blender() -> Generator[MagicMock | AsyncMock, None, None]:
+def fixture_mock_get_blender() -> Generator[MagicMock, None, None]:
     """Fixture that mocks the Blender executable path."""
     with patch("devin.cli.get_blender") as mock:
         mock.return_value = Path(
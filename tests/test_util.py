@@ -0,0 +1,82 @@
+# Copyright (C) 2025 Henrik Wilhelmsen.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at <https://mozilla.org/MPL/2.0/>.
+
+"""Devin DCC utilities tests."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from devin_dcc.util import get_user_root_dir, launch_executable
+
+
+class _ExecError(Exception):
+    """Raised by the mocked os.execvpe in place of replacing the process."""
+
+
+def test_get_user_root_dir(tmp_path: Path) -> None:
+    """Test that the user root dir is created, and reused if it exists."""
+    root_dir = tmp_path / "devin" / "root"
+
+    with patch("devin_dcc.util.DEVIN_ROOT_DIR", root_dir):
+        assert get_user_root_dir() == root_dir
+        assert root_dir.is_dir()
+        assert get_user_root_dir() == root_dir
+
+
+def test_launch_executable_posix() -> None:
+    """Test that the current process is replaced by the executable on POSIX."""
+    args = ["/usr/bin/blender", "--foo"]
+    env = {"FOO": "bar"}
+
+    with (
+        patch("devin_dcc.util.sys.platform", "linux"),
+        # Raise like a never-returning exec, so falling through would be noticed
+        patch("devin_dcc.util.os.execvpe", side_effect=_ExecError) as mock_execvpe,
+        patch("devin_dcc.util.call") as mock_call,
+        pytest.raises(_ExecError),
+    ):
+        _ = launch_executable(args=args, env=env)
+
+    mock_execvpe.assert_called_once_with(args[0], args, env)
+    mock_call.assert_not_called()
+
+
+def test_launch_executable_windows() -> None:
+    """Test that the executable is run as a child process on Windows."""
+    args = ["C:/Program Files/Blender Foundation/Blender 4.4/blender.exe"]
+    env = {"FOO": "bar"}
+
+    with (
+        patch("devin_dcc.util.sys.platform", "win32"),
+        patch("devin_dcc.util.os.execvpe") as mock_execvpe,
+        patch("devin_dcc.util.call") as mock_call,
+    ):
+        mock_call.return_value = 0
+        result = launch_executable(args=args, env=env)
+
+    mock_execvpe.assert_not_called()
+    mock_call.assert_called_once_with(args=args, env=env)
+    assert result == 0
+
+
+def test_launch_executable_wait() -> None:
+    """Test that the executable is run as a child process when waiting on it."""
+    args = ["/usr/bin/blender"]
+    env = {"FOO": "bar"}
+
+    with (
+        patch("devin_dcc.util.sys.platform", "linux"),
+        patch("devin_dcc.util.os.execvpe") as mock_execvpe,
+        patch("devin_dcc.util.call") as mock_call,
+    ):
+        mock_call.return_value = 0
+        result = launch_executable(args=args, env=env, wait=True)
+
+    mock_execvpe.assert_not_called()
+    mock_call.assert_called_once_with(args=args, env=env)
+    assert result == 0